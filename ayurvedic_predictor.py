@@ -1,26 +1,249 @@
+import os
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
 import joblib
 import json
-from typing import List, Dict, Tuple
+import pickle
+import re
+
+# Optional Numba JIT for the per-row probability aggregation
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional ONNX Runtime backend that serves the forest as a compiled graph
+try:
+    import onnxruntime
+    from skl2onnx import to_onnx
+except ImportError:
+    onnxruntime = None
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Tuple, Union
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _aggregate_probs(probabilities: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Best class index and probability per row; index is -1 below threshold"""
+        n_rows, n_classes = probabilities.shape
+        best_indices = np.empty(n_rows, dtype=np.int64)
+        best_probabilities = np.empty(n_rows, dtype=np.float64)
+        for i in range(n_rows):
+            best = 0
+            for j in range(1, n_classes):
+                if probabilities[i, j] > probabilities[i, best]:
+                    best = j
+            best_probabilities[i] = probabilities[i, best]
+            best_indices[i] = best if probabilities[i, best] >= threshold else -1
+        return best_indices, best_probabilities
+else:
+    def _aggregate_probs(probabilities: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Best class index and probability per row; index is -1 below threshold"""
+        best_indices = probabilities.argmax(axis=1)
+        best_probabilities = probabilities[np.arange(len(best_indices)), best_indices]
+        return np.where(best_probabilities >= threshold, best_indices, -1), best_probabilities
+
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+def normalize_symptoms(symptoms: Union[str, List[str]]) -> List[str]:
+    """Lowercase symptoms and collapse their whitespace, dropping blanks and repeats; a string is split on commas"""
+    if isinstance(symptoms, str):
+        symptoms = symptoms.split(',')
+    normalized = (_WHITESPACE_RUN.sub(' ', symptom).strip().lower() for symptom in symptoms)
+    return list(dict.fromkeys(symptom for symptom in normalized if symptom))
+
+# sklearn's default word pattern; the bound findall is picklable, unlike a
+# function defined here, so saved vectorizers load from any entry point
+_WORD_TOKENS = re.compile(r"(?u)\b\w\w+\b")
+
+def split_symptom_words(symptoms_text: str) -> List[str]:
+    """Split a symptom string into lowercased words, minus stop words, as the vectorizer does"""
+    return [word for word in _WORD_TOKENS.findall(symptoms_text.lower()) if word not in ENGLISH_STOP_WORDS]
+
+# Symptom-specific recommendations database
+_SYMPTOM_RECS = {
+    'dry skin': {
+        'vata': 'Apply warm sesame oil massage daily, use oil-based moisturizers',
+        'remedy': 'Stay hydrated, consume healthy fats like ghee and nuts'
+    },
+    'constipation': {
+        'vata': 'Drink warm water in morning, consume fiber-rich foods, take triphala at night',
+        'remedy': 'Include cooked vegetables, warm soups, and avoid cold/dry foods'
+    },
+    'anxiety': {
+        'vata': 'Practice meditation and pranayama, maintain regular sleep schedule',
+        'remedy': 'Use calming herbs like ashwagandha, reduce caffeine intake'
+    },
+    'joint pain': {
+        'vata': 'Perform gentle yoga, apply warm oil massage on affected joints',
+        'remedy': 'Consume turmeric milk, avoid cold and raw foods'
+    },
+    'acidity': {
+        'pitta': 'Avoid spicy, oily, and fried foods, eat cooling foods like cucumber',
+        'remedy': 'Drink coconut water, consume aloe vera juice before meals'
+    },
+    'anger': {
+        'pitta': 'Practice cooling pranayama (sitali), avoid heated arguments',
+        'remedy': 'Use cooling herbs like coriander, reduce exposure to heat and sun'
+    },
+    'burning sensation': {
+        'pitta': 'Consume cooling foods like buttermilk, avoid hot spices',
+        'remedy': 'Apply cooling sandalwood paste, drink plenty of water'
+    },
+    'inflammation': {
+        'pitta': 'Use anti-inflammatory herbs like turmeric and neem',
+        'remedy': 'Avoid acidic foods, consume sweet fruits and vegetables'
+    },
+    'congestion': {
+        'kapha': 'Perform steam inhalation with eucalyptus, avoid dairy products',
+        'remedy': 'Drink warm ginger tea, use black pepper in meals'
+    },
+    'weight gain': {
+        'kapha': 'Increase physical activity, eat light and warm foods',
+        'remedy': 'Avoid heavy, oily foods, practice intermittent fasting'
+    },
+    'lethargy': {
+        'kapha': 'Wake up before sunrise, engage in vigorous exercise',
+        'remedy': 'Consume stimulating spices like ginger, reduce daytime sleep'
+    },
+    'cold limbs': {
+        'kapha': 'Keep body warm, perform active movements',
+        'remedy': 'Drink warm beverages, use warming spices in cooking'
+    },
+    'headache': {
+        'all': 'Apply cooling paste on forehead, practice pranayama',
+        'remedy': 'Stay hydrated, get adequate rest, avoid stress triggers'
+    },
+    'fatigue': {
+        'all': 'Ensure proper sleep, consume nutritious meals',
+        'remedy': 'Practice yoga, take adaptogenic herbs like ashwagandha'
+    },
+    'insomnia': {
+        'vata': 'Establish regular sleep routine, drink warm milk with nutmeg',
+        'remedy': 'Practice relaxation techniques, avoid screens before bed'
+    },
+    'excessive heat': {
+        'pitta': 'Stay in cool environment, avoid sun exposure during peak hours',
+        'remedy': 'Consume cooling beverages, apply sandalwood paste'
+    },
+    'excessive sleep': {
+        'kapha': 'Reduce sleep duration gradually, establish wake-up routine',
+        'remedy': 'Avoid heavy meals at night, practice morning exercises'
+    },
+    'irregular digestion': {
+        'vata': 'Eat at regular times, consume warm cooked meals',
+        'remedy': 'Use digestive spices like cumin, avoid eating in stress'
+    }
+}
+
+# Base recommendations by dosha
+_BASE_RECS = {
+    "vata": {
+        "diet": [
+            "Favor warm, cooked, and nourishing foods",
+            "Include sweet, sour, and salty tastes",
+            "Consume healthy fats like ghee, nuts, and seeds",
+            "Avoid cold, raw, and dry foods",
+            "Eat at regular times"
+        ],
+        "lifestyle": [
+            "Maintain regular daily routines",
+            "Practice oil massage (abhyanga) with warm sesame oil",
+            "Ensure adequate rest and avoid overexertion",
+            "Keep warm and avoid cold, windy environments",
+            "Practice calming yoga and meditation"
+        ],
+        "herbs": ["Ashwagandha", "Triphala", "Brahmi", "Shatavari"],
+        "yoga": ["Gentle stretching", "Grounding poses", "Forward bends", "Restorative yoga"]
+    },
+    "pitta": {
+        "diet": [
+            "Favor cool, fresh, and sweet foods",
+            "Include bitter and astringent tastes",
+            "Consume cooling vegetables like cucumber, leafy greens",
+            "Avoid spicy, oily, fried, and acidic foods",
+            "Drink plenty of water and coconut water"
+        ],
+        "lifestyle": [
+            "Avoid excessive heat and sun exposure",
+            "Practice stress management techniques",
+            "Engage in moderate, not competitive exercise",
+            "Take cool showers and wear cooling colors",
+            "Maintain work-life balance"
+        ],
+        "herbs": ["Neem", "Coriander", "Aloe vera", "Amla"],
+        "yoga": ["Cooling pranayama", "Moon salutations", "Gentle backbends", "Meditation"]
+    },
+    "kapha": {
+        "diet": [
+            "Favor light, warm, and dry foods",
+            "Include pungent, bitter, and astringent tastes",
+            "Consume stimulating spices like ginger, black pepper",
+            "Avoid heavy, oily, and dairy-rich foods",
+            "Reduce portion sizes and avoid overeating"
+        ],
+        "lifestyle": [
+            "Engage in regular vigorous exercise",
+            "Wake up early, preferably before sunrise",
+            "Perform dry massage (garshana)",
+            "Stay active and avoid excessive sleep",
+            "Seek variety and new experiences"
+        ],
+        "herbs": ["Trikatu", "Guggulu", "Turmeric", "Tulsi"],
+        "yoga": ["Vigorous vinyasa", "Sun salutations", "Backbends", "Inversions"]
+    }
+}
+
+# Keyword symptoms with a single dosha in the recommendation table, used by
+# the lookup classifier when the ML model is disabled
+SYMPTOM_TO_DOSHA = {
+    symptom: dosha
+    for symptom, rec in _SYMPTOM_RECS.items()
+    for dosha in ('vata', 'pitta', 'kapha')
+    if dosha in rec
+}
+LOOKUP_CLASSES = np.array(sorted(set(SYMPTOM_TO_DOSHA.values())))
 
 class AyurvedicPredictor:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-        self.classifier = RandomForestClassifier(n_estimators=100, random_state=42)
+    def __init__(self, use_ml: bool = True):
+        # Hashed token counts re-weighted by TF-IDF; no vocabulary to store or look up.
+        # float32 output is what the trees consume, so predict_proba needs no copy
+        self.vectorizer = Pipeline([
+            ('hash', HashingVectorizer(
+                n_features=1024, tokenizer=_WORD_TOKENS.findall, token_pattern=None,
+                stop_words='english', alternate_sign=False, norm=None, dtype=np.float32
+            )),
+            ('tfidf', TfidfTransformer())
+        ])
+        self.classifier = RandomForestClassifier(n_estimators=40, ccp_alpha=1e-3, random_state=42, n_jobs=-1)
         self.model_loaded = False
+        self._fast_predictor = None
+        
+        # Set to False to score symptoms with the SYMPTOM_TO_DOSHA lookup
+        # instead of the trained model
+        self.use_ml = use_ml
         
         # Threshold for prediction confidence
         self.confidence_threshold = 0.3
         
+        # Per-instance memo of vectorized symptoms and their class probabilities
+        self._vectorize_cached = lru_cache(maxsize=4096)(self._vectorize)
+        self._predict_proba_cached = lru_cache(maxsize=4096)(self._predict_proba)
+        
     def load_data(self, csv_path: str = 'symptoms_dataset.csv') -> pd.DataFrame:
         """Load the symptoms dataset"""
         try:
-            df = pd.read_csv(csv_path)
+            # Only the symptom text and label are used; the label has four values
+            df = pd.read_csv(
+                csv_path, usecols=['symptoms', 'dosha'], dtype={'symptoms': 'string', 'dosha': 'category'}
+            )
             print(f"Dataset loaded successfully with {len(df)} records")
             return df
         except FileNotFoundError:
@@ -31,56 +254,209 @@ class AyurvedicPredictor:
         """Convert list of symptoms to a single string"""
         return ' '.join(symptoms).lower()
         
-    def train_model(self, csv_path: str = 'symptoms_dataset.csv'):
-        """Train the machine learning model"""
+    def train_model(self, csv_path: str = 'symptoms_dataset.csv', verbose: bool = False):
+        """Train the machine learning model; evaluate on the held-out split when verbose"""
         df = self.load_data(csv_path)
         if df is None:
             return
             
-        # Prepare features and labels
-        X = df['symptoms'].values
-        y = df['dosha'].values
+        # Collapse duplicate rows into one weighted sample each
+        unique_cases = df.groupby(['symptoms', 'dosha'], observed=True).size().reset_index(name='weight')
+        
+        # Prepare features, labels and sample weights
+        X = unique_cases['symptoms'].values
+        y = unique_cases['dosha'].values
+        weights = unique_cases['weight'].to_numpy()
         
         # Vectorize the symptoms text
         X_vectorized = self.vectorizer.fit_transform(X)
         
+        # Hashing keeps no vocabulary, so remember the training words alongside the
+        # fitted vectorizer; inputs with none of them never need to reach the model
+        self.vectorizer.known_words_ = frozenset(
+            word for text in X for word in split_symptom_words(text)
+        )
+        
         # Split the data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_vectorized, y, test_size=0.2, random_state=42, stratify=y
+        X_train, X_test, y_train, y_test, w_train, w_test = train_test_split(
+            X_vectorized, y, weights, test_size=0.2, random_state=42, stratify=y
         )
         
         # Train the classifier
-        self.classifier.fit(X_train, y_train)
+        self.classifier.fit(X_train, y_train, sample_weight=w_train)
+        self._snap_thresholds_to_float32()
+        self._use_fitted_model()
+        
+        print(f"Model trained successfully!")
         
         # Evaluate the model
-        y_pred = self.classifier.predict(X_test)
-        accuracy = accuracy_score(y_test, y_pred)
+        if verbose:
+            y_pred = self.classifier.predict(X_test)
+            accuracy = accuracy_score(y_test, y_pred, sample_weight=w_test)
+            
+            print(f"Forest size: {sum(tree.tree_.node_count for tree in self.classifier.estimators_)} nodes")
+            print(f"Accuracy: {accuracy:.2f}")
+            print("\nClassification Report:")
+            print(classification_report(y_test, y_pred, sample_weight=w_test))
         
-        print(f"Model trained successfully!")
-        print(f"Accuracy: {accuracy:.2f}")
-        print("\nClassification Report:")
-        print(classification_report(y_test, y_pred))
+        # Save the model and vectorizer
+        self.save_model()
+        
+    def retrain(self, new_csv_path: str, additional_trees: int = 20):
+        """Grow extra trees on new data, keeping the existing forest"""
+        if not hasattr(self.classifier, 'estimators_'):
+            print("No trained model to extend. Please train or load the model first.")
+            return
+            
+        df = self.load_data(new_csv_path)
+        if df is None:
+            return
+            
+        # Collapse duplicate rows into one weighted sample each, as in train_model
+        unique_cases = df.groupby(['symptoms', 'dosha'], observed=True).size().reset_index(name='weight')
+        X = unique_cases['symptoms'].values
+        y = unique_cases['dosha'].values
+        weights = unique_cases['weight'].to_numpy()
+        
+        # The new trees vote alongside the old ones, so they must see exactly the same classes
+        if set(y) != set(self.classifier.classes_):
+            print(f"New data has classes {sorted(set(y))}, but the model predicts "
+                  f"{list(self.classifier.classes_)}. Retraining skipped.")
+            return
+        
+        # Reuse the fitted vectorizer so the existing trees see the same features
+        X_vectorized = self.vectorizer.transform(X).astype(np.float32, copy=False)
+        
+        if getattr(self.vectorizer, 'known_words_', None) is not None:
+            self.vectorizer.known_words_ |= frozenset(
+                word for text in X for word in split_symptom_words(text)
+            )
+        
+        # With warm_start only the additional trees are grown
+        self.classifier.set_params(
+            warm_start=True, n_estimators=len(self.classifier.estimators_) + additional_trees
+        )
+        self.classifier.fit(X_vectorized, y, sample_weight=weights)
+        self.classifier.set_params(warm_start=False)
+        self._snap_thresholds_to_float32()
+        self._use_fitted_model()
+        
+        print(f"Model extended to {len(self.classifier.estimators_)} trees!")
         
         # Save the model and vectorizer
         self.save_model()
         
+    def _snap_thresholds_to_float32(self):
+        """Round every split threshold to the nearest float32 value.
+
+        Features reach the trees as float32 and the ONNX export stores its
+        thresholds as float32, so this keeps both backends making identical
+        splits.
+        """
+        for estimator in self.classifier.estimators_:
+            threshold = estimator.tree_.threshold
+            threshold[:] = threshold.astype(np.float32)
+        
     def save_model(self):
         """Save the trained model and vectorizer"""
-        joblib.dump(self.classifier, 'ayurvedic_classifier.pkl')
-        joblib.dump(self.vectorizer, 'symptoms_vectorizer.pkl')
+        # The classifier stays uncompressed so it loads without a decompression
+        # pass; the vectorizer only holds a small idf vector, so compress it.
+        # The classifier is written beside the old file and swapped in, since a
+        # loaded classifier may still be memory-mapped from it
+        joblib.dump(self.classifier, 'ayurvedic_classifier.pkl.tmp')
+        os.replace('ayurvedic_classifier.pkl.tmp', 'ayurvedic_classifier.pkl')
+        joblib.dump(self.vectorizer, 'symptoms_vectorizer.pkl', compress=3)
+        
+        # Export an ONNX copy of the forest for faster serving. Any stale copy is
+        # dropped first so it never shadows this model if the export is skipped or fails
+        if os.path.exists('ayurvedic_classifier.onnx'):
+            os.remove('ayurvedic_classifier.onnx')
+        if onnxruntime is not None:
+            try:
+                sample = np.zeros((1, self.classifier.n_features_in_), dtype=np.float32)
+                onnx_model = to_onnx(self.classifier, sample, options={id(self.classifier): {'zipmap': False}})
+                with open('ayurvedic_classifier.onnx.tmp', 'wb') as f:
+                    f.write(onnx_model.SerializeToString())
+                os.replace('ayurvedic_classifier.onnx.tmp', 'ayurvedic_classifier.onnx')
+            except Exception as e:
+                print(f"Warning: ONNX export failed ({e}); predictions will use scikit-learn.")
         print("Model and vectorizer saved successfully!")
         
     def load_model(self):
         """Load the trained model and vectorizer"""
         try:
-            self.classifier = joblib.load('ayurvedic_classifier.pkl')
-            self.vectorizer = joblib.load('symptoms_vectorizer.pkl')
+            # The files are independent, so read and unpickle them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                classifier = executor.submit(joblib.load, 'ayurvedic_classifier.pkl', mmap_mode='r')
+                vectorizer = executor.submit(joblib.load, 'symptoms_vectorizer.pkl')
+                fast_predictor = None
+                if onnxruntime is not None and os.path.exists('ayurvedic_classifier.onnx'):
+                    fast_predictor = executor.submit(
+                        onnxruntime.InferenceSession, 'ayurvedic_classifier.onnx', providers=['CPUExecutionProvider']
+                    )
+                self.classifier = classifier.result()
+                self.vectorizer = vectorizer.result()
+                self._fast_predictor = None
+                if fast_predictor is not None:
+                    # The ONNX copy is only an accelerator; a broken one falls back to scikit-learn
+                    try:
+                        self._fast_predictor = fast_predictor.result()
+                    except Exception as e:
+                        print(f"Warning: ONNX model could not be loaded ({e}); using scikit-learn.")
+            self._clear_caches()
             self.model_loaded = True
             print("Model loaded successfully!")
         except FileNotFoundError:
             print("Model files not found. Please train the model first.")
             self.model_loaded = False
+        except (AttributeError, ImportError, EOFError, KeyError, ValueError, pickle.UnpicklingError) as e:
+            print(f"Model files could not be loaded ({e}). Please retrain the model.")
+            self.model_loaded = False
             
+    def _use_fitted_model(self):
+        """Serve predictions from the just-fitted in-memory model without reloading it"""
+        # An ONNX session loaded earlier still holds the previous forest
+        self._fast_predictor = None
+        self._clear_caches()
+        self.model_loaded = True
+        
+    def _clear_caches(self):
+        """Drop memoized results that belong to a previous model"""
+        self._vectorize_cached.cache_clear()
+        self._predict_proba_cached.cache_clear()
+        
+    def _vectorize(self, symptoms_text: str):
+        """Vectorize a preprocessed symptom string"""
+        return self.vectorizer.transform([symptoms_text]).astype(np.float32, copy=False)
+        
+    def _classifier_proba(self, X) -> np.ndarray:
+        """Class probabilities for vectorized symptoms, via ONNX Runtime when loaded"""
+        if self._fast_predictor is None:
+            return self.classifier.predict_proba(X)
+        input_name = self._fast_predictor.get_inputs()[0].name
+        probabilities = self._fast_predictor.run(['probabilities'], {input_name: X.toarray().astype(np.float32, copy=False)})[0]
+        return probabilities.astype(np.float64)
+        
+    def _predict_proba(self, symptoms_text: str) -> np.ndarray:
+        """Class probabilities for a preprocessed symptom string"""
+        return self._classifier_proba(self._vectorize_cached(symptoms_text))[0]
+        
+    def _has_known_words(self, symptoms_text: str) -> bool:
+        """Whether a preprocessed symptom string shares any word with the training data"""
+        # Vectorizers saved before the word set was recorded accept everything
+        known_words = getattr(self.vectorizer, 'known_words_', None)
+        if known_words is None:
+            return True
+        return any(word in known_words for word in split_symptom_words(symptoms_text))
+        
+    def _lookup_proba(self, symptoms: List[str]) -> np.ndarray:
+        """Class probabilities from counting known keyword symptoms per dosha"""
+        counts = Counter(SYMPTOM_TO_DOSHA[s] for s in map(str.lower, symptoms) if s in SYMPTOM_TO_DOSHA)
+        total = sum(counts.values())
+        if not total:
+            return np.zeros(len(LOOKUP_CLASSES))
+        return np.array([counts[dosha] / total for dosha in LOOKUP_CLASSES])
+        
     def predict(self, symptoms: List[str]) -> Dict[str, any]:
         """
         Predict dosha based on symptoms
@@ -91,184 +467,61 @@ class AyurvedicPredictor:
         Returns:
             Dictionary with prediction results
         """
+        if not self.use_ml:
+            return self._format_results(self._lookup_proba(symptoms)[np.newaxis], [symptoms], LOOKUP_CLASSES)[0]
+            
         if not self.model_loaded:
             return {"error": "Model not loaded. Please load model first."}
             
         # Preprocess symptoms
         symptoms_text = self.preprocess_symptoms(symptoms)
         
-        # Vectorize symptoms
-        symptoms_vectorized = self.vectorizer.transform([symptoms_text])
+        # Get prediction probabilities (memoized per symptom string); symptoms the
+        # model never saw get zero probabilities and fall back without scoring
+        if self._has_known_words(symptoms_text):
+            probabilities = self._predict_proba_cached(symptoms_text)
+        else:
+            probabilities = np.zeros(len(self.classifier.classes_))
         
-        # Get prediction probabilities
-        probabilities = self.classifier.predict_proba(symptoms_vectorized)[0]
+        return self._format_results(probabilities[np.newaxis], [symptoms])[0]
         
+    def _format_results(self, probabilities: np.ndarray, symptoms_list: List[List[str]], classes: np.ndarray = None) -> List[Dict[str, any]]:
+        """Build prediction results from a (n_samples, n_classes) probability matrix"""
         # Get class names
-        classes = self.classifier.classes_
+        if classes is None:
+            classes = self.classifier.classes_
+        class_names = classes.tolist()
         
-        # Create result dictionary
-        dosha_probabilities = {}
-        for i, dosha in enumerate(classes):
-            dosha_probabilities[dosha] = round(probabilities[i] * 100, 2)
-            
-        # Find the best prediction
-        max_prob_idx = np.argmax(probabilities)
-        best_dosha = classes[max_prob_idx]
-        best_probability = probabilities[max_prob_idx]
-        
-        # Check if prediction is confident enough
-        if best_probability < self.confidence_threshold:
-            prediction = "not vatham pitham or kapham"
-            confidence = "Low confidence - symptoms don't clearly match known patterns"
-        else:
-            prediction = best_dosha
-            confidence = f"{best_probability * 100:.2f}%"
-            
-        return {
-            "prediction": prediction,
-            "confidence": confidence,
-            "dosha_percentages": dosha_probabilities,
-            "symptoms_analyzed": symptoms,
-            "recommendation": self._get_recommendation(prediction, symptoms)
-        }
+        # Percentages and best predictions for every row at once
+        percentages = np.round(probabilities * 100, 2).tolist()
+        best_indices, best_probabilities = _aggregate_probs(
+            np.ascontiguousarray(probabilities, dtype=np.float64), self.confidence_threshold
+        )
+        
+        results = []
+        for symptoms, row_percentages, best_idx, best_probability in zip(
+            symptoms_list, percentages, best_indices.tolist(), best_probabilities.tolist()
+        ):
+            # Check if prediction is confident enough
+            if best_idx < 0:
+                prediction = "not vatham pitham or kapham"
+                confidence = "Low confidence - symptoms don't clearly match known patterns"
+            else:
+                prediction = class_names[best_idx]
+                confidence = f"{best_probability * 100:.2f}%"
+                
+            results.append({
+                "prediction": prediction,
+                "confidence": confidence,
+                "dosha_percentages": dict(zip(class_names, row_percentages)),
+                "symptoms_analyzed": symptoms,
+                "recommendation": self._get_recommendation(prediction, symptoms)
+            })
+        return results
         
     def _get_recommendation(self, dosha: str, symptoms: List[str] = None) -> Dict[str, any]:
         """Get personalized recommendations based on dosha and symptoms"""
         
-        # Symptom-specific recommendations database
-        symptom_recommendations = {
-            'dry skin': {
-                'vata': 'Apply warm sesame oil massage daily, use oil-based moisturizers',
-                'remedy': 'Stay hydrated, consume healthy fats like ghee and nuts'
-            },
-            'constipation': {
-                'vata': 'Drink warm water in morning, consume fiber-rich foods, take triphala at night',
-                'remedy': 'Include cooked vegetables, warm soups, and avoid cold/dry foods'
-            },
-            'anxiety': {
-                'vata': 'Practice meditation and pranayama, maintain regular sleep schedule',
-                'remedy': 'Use calming herbs like ashwagandha, reduce caffeine intake'
-            },
-            'joint pain': {
-                'vata': 'Perform gentle yoga, apply warm oil massage on affected joints',
-                'remedy': 'Consume turmeric milk, avoid cold and raw foods'
-            },
-            'acidity': {
-                'pitta': 'Avoid spicy, oily, and fried foods, eat cooling foods like cucumber',
-                'remedy': 'Drink coconut water, consume aloe vera juice before meals'
-            },
-            'anger': {
-                'pitta': 'Practice cooling pranayama (sitali), avoid heated arguments',
-                'remedy': 'Use cooling herbs like coriander, reduce exposure to heat and sun'
-            },
-            'burning sensation': {
-                'pitta': 'Consume cooling foods like buttermilk, avoid hot spices',
-                'remedy': 'Apply cooling sandalwood paste, drink plenty of water'
-            },
-            'inflammation': {
-                'pitta': 'Use anti-inflammatory herbs like turmeric and neem',
-                'remedy': 'Avoid acidic foods, consume sweet fruits and vegetables'
-            },
-            'congestion': {
-                'kapha': 'Perform steam inhalation with eucalyptus, avoid dairy products',
-                'remedy': 'Drink warm ginger tea, use black pepper in meals'
-            },
-            'weight gain': {
-                'kapha': 'Increase physical activity, eat light and warm foods',
-                'remedy': 'Avoid heavy, oily foods, practice intermittent fasting'
-            },
-            'lethargy': {
-                'kapha': 'Wake up before sunrise, engage in vigorous exercise',
-                'remedy': 'Consume stimulating spices like ginger, reduce daytime sleep'
-            },
-            'cold limbs': {
-                'kapha': 'Keep body warm, perform active movements',
-                'remedy': 'Drink warm beverages, use warming spices in cooking'
-            },
-            'headache': {
-                'all': 'Apply cooling paste on forehead, practice pranayama',
-                'remedy': 'Stay hydrated, get adequate rest, avoid stress triggers'
-            },
-            'fatigue': {
-                'all': 'Ensure proper sleep, consume nutritious meals',
-                'remedy': 'Practice yoga, take adaptogenic herbs like ashwagandha'
-            },
-            'insomnia': {
-                'vata': 'Establish regular sleep routine, drink warm milk with nutmeg',
-                'remedy': 'Practice relaxation techniques, avoid screens before bed'
-            },
-            'excessive heat': {
-                'pitta': 'Stay in cool environment, avoid sun exposure during peak hours',
-                'remedy': 'Consume cooling beverages, apply sandalwood paste'
-            },
-            'excessive sleep': {
-                'kapha': 'Reduce sleep duration gradually, establish wake-up routine',
-                'remedy': 'Avoid heavy meals at night, practice morning exercises'
-            },
-            'irregular digestion': {
-                'vata': 'Eat at regular times, consume warm cooked meals',
-                'remedy': 'Use digestive spices like cumin, avoid eating in stress'
-            }
-        }
-        
-        # Base recommendations by dosha
-        base_recommendations = {
-            "vata": {
-                "diet": [
-                    "Favor warm, cooked, and nourishing foods",
-                    "Include sweet, sour, and salty tastes",
-                    "Consume healthy fats like ghee, nuts, and seeds",
-                    "Avoid cold, raw, and dry foods",
-                    "Eat at regular times"
-                ],
-                "lifestyle": [
-                    "Maintain regular daily routines",
-                    "Practice oil massage (abhyanga) with warm sesame oil",
-                    "Ensure adequate rest and avoid overexertion",
-                    "Keep warm and avoid cold, windy environments",
-                    "Practice calming yoga and meditation"
-                ],
-                "herbs": ["Ashwagandha", "Triphala", "Brahmi", "Shatavari"],
-                "yoga": ["Gentle stretching", "Grounding poses", "Forward bends", "Restorative yoga"]
-            },
-            "pitta": {
-                "diet": [
-                    "Favor cool, fresh, and sweet foods",
-                    "Include bitter and astringent tastes",
-                    "Consume cooling vegetables like cucumber, leafy greens",
-                    "Avoid spicy, oily, fried, and acidic foods",
-                    "Drink plenty of water and coconut water"
-                ],
-                "lifestyle": [
-                    "Avoid excessive heat and sun exposure",
-                    "Practice stress management techniques",
-                    "Engage in moderate, not competitive exercise",
-                    "Take cool showers and wear cooling colors",
-                    "Maintain work-life balance"
-                ],
-                "herbs": ["Neem", "Coriander", "Aloe vera", "Amla"],
-                "yoga": ["Cooling pranayama", "Moon salutations", "Gentle backbends", "Meditation"]
-            },
-            "kapha": {
-                "diet": [
-                    "Favor light, warm, and dry foods",
-                    "Include pungent, bitter, and astringent tastes",
-                    "Consume stimulating spices like ginger, black pepper",
-                    "Avoid heavy, oily, and dairy-rich foods",
-                    "Reduce portion sizes and avoid overeating"
-                ],
-                "lifestyle": [
-                    "Engage in regular vigorous exercise",
-                    "Wake up early, preferably before sunrise",
-                    "Perform dry massage (garshana)",
-                    "Stay active and avoid excessive sleep",
-                    "Seek variety and new experiences"
-                ],
-                "herbs": ["Trikatu", "Guggulu", "Turmeric", "Tulsi"],
-                "yoga": ["Vigorous vinyasa", "Sun salutations", "Backbends", "Inversions"]
-            }
-        }
-        
         if dosha == "not vatham pitham or kapham":
             return {
                 "general": "Your symptoms don't clearly match traditional Ayurvedic dosha patterns. This could indicate a complex imbalance or non-Ayurvedic condition.",
@@ -277,7 +530,7 @@ class AyurvedicPredictor:
             }
         
         # Get base recommendations
-        base = base_recommendations.get(dosha, {})
+        base = _BASE_RECS.get(dosha, {})
         
         # Collect symptom-specific recommendations
         specific_recommendations = []
@@ -285,9 +538,8 @@ class AyurvedicPredictor:
         
         if symptoms:
             for symptom in symptoms:
-                symptom_lower = symptom.lower()
-                if symptom_lower in symptom_recommendations:
-                    rec = symptom_recommendations[symptom_lower]
+                rec = _SYMPTOM_RECS.get(symptom.lower())
+                if rec is not None:
                     if dosha in rec:
                         specific_recommendations.append(f"For {symptom}: {rec[dosha]}")
                     elif 'all' in rec:
@@ -297,22 +549,42 @@ class AyurvedicPredictor:
         
         return {
             "dosha": dosha.upper(),
-            "diet": base.get("diet", []),
-            "lifestyle": base.get("lifestyle", []),
-            "herbs": base.get("herbs", []),
-            "yoga": base.get("yoga", []),
+            "diet": list(base.get("diet", [])),
+            "lifestyle": list(base.get("lifestyle", [])),
+            "herbs": list(base.get("herbs", [])),
+            "yoga": list(base.get("yoga", [])),
             "specific_recommendations": specific_recommendations if specific_recommendations else ["Maintain balanced lifestyle according to general dosha guidelines"],
             "remedies": remedies if remedies else ["Follow general dosha-balancing practices"],
             "note": f"These recommendations are for balancing {dosha.upper()} dosha. Always consult an Ayurvedic practitioner for personalized treatment."
         }
         
+    def predict_proba_batch(self, symptoms_list: List[List[str]]) -> np.ndarray:
+        """Model class probabilities, one row per symptom set, in classifier.classes_ order"""
+        # Vectorize and score every symptom set with known words in a single pass
+        texts = [self.preprocess_symptoms(symptoms) for symptoms in symptoms_list]
+        known = np.array([self._has_known_words(text) for text in texts], dtype=bool)
+        probabilities = np.zeros((len(texts), len(self.classifier.classes_)))
+        if known.any():
+            known_texts = [text for text, is_known in zip(texts, known) if is_known]
+            probabilities[known] = self._classifier_proba(
+                self.vectorizer.transform(known_texts).astype(np.float32, copy=False)
+            )
+        return probabilities
+        
+    def format_prediction(self, probabilities: np.ndarray, symptoms: List[str]) -> Dict[str, any]:
+        """Prediction result for one symptom set from its row of predict_proba_batch"""
+        return self._format_results(probabilities[np.newaxis], [symptoms])[0]
+        
     def predict_batch(self, symptoms_list: List[List[str]]) -> List[Dict[str, any]]:
         """Predict dosha for multiple symptom sets"""
-        results = []
-        for symptoms in symptoms_list:
-            result = self.predict(symptoms)
-            results.append(result)
-        return results
+        if not self.use_ml:
+            return [self.predict(symptoms) for symptoms in symptoms_list]
+        if not self.model_loaded:
+            return [{"error": "Model not loaded. Please load model first."} for _ in symptoms_list]
+        if not symptoms_list:
+            return []
+        
+        return self._format_results(self.predict_proba_batch(symptoms_list), symptoms_list)
 
 # Example usage
 if __name__ == "__main__":
@@ -323,8 +595,7 @@ if __name__ == "__main__":
     
     if not predictor.model_loaded:
         print("Training new model...")
-        predictor.train_model()
-        predictor.load_model()
+        predictor.train_model(verbose=True)
     
     # Test predictions
     test_symptoms = [
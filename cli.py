@@ -6,7 +6,12 @@ Quick and easy way to test symptom predictions
 
 import sys
 import argparse
-from ayurvedic_predictor import AyurvedicPredictor
+from ayurvedic_predictor import AyurvedicPredictor, normalize_symptoms
+
+_DOSHA_ICONS = {'VATA': '🌬️', 'PITTA': '🔥', 'KAPHA': '🌊'}
+
+# Percentage bars, one block per 5%
+_PERCENTAGE_BARS = tuple('█' * i for i in range(21))
 
 def print_dosha_info():
     """Print information about the three doshas"""
@@ -44,8 +49,7 @@ def format_prediction_result(result):
         output.append(f"🔍 PREDICTION: {prediction}")
         output.append("   (Symptoms don't clearly match known Ayurvedic patterns)")
     else:
-        dosha_icons = {'VATA': '🌬️', 'PITTA': '🔥', 'KAPHA': '🌊'}
-        icon = dosha_icons.get(prediction, '❓')
+        icon = _DOSHA_ICONS.get(prediction, '❓')
         output.append(f"🎯 PREDICTION: {icon} {prediction}")
     
     # Confidence
@@ -55,8 +59,8 @@ def format_prediction_result(result):
     output.append("📈 DOSHA PERCENTAGES:")
     for dosha, percentage in result['dosha_percentages'].items():
         dosha_upper = dosha.upper()
-        icon = {'VATA': '🌬️', 'PITTA': '🔥', 'KAPHA': '🌊'}.get(dosha_upper, '❓')
-        bars = '█' * int(percentage / 5)  # Visual bar
+        icon = _DOSHA_ICONS.get(dosha_upper, '❓')
+        bars = _PERCENTAGE_BARS[min(20, int(percentage) // 5)]  # Visual bar
         output.append(f"   {icon} {dosha_upper:5}: {percentage:5.1f}% {bars}")
     
     # Recommendation
@@ -106,7 +110,7 @@ def interactive_mode(predictor):
                 continue
             
             # Parse symptoms
-            symptoms = [s.strip().lower() for s in user_input.split(',') if s.strip()]
+            symptoms = normalize_symptoms(user_input)
             
             if not symptoms:
                 print("Please enter valid symptoms.")
@@ -203,7 +207,7 @@ Doshas:
     
     # Prediction from arguments
     if args.symptoms:
-        symptoms = [s.lower() for s in args.symptoms]
+        symptoms = normalize_symptoms(args.symptoms)
         predict_from_args(predictor, symptoms)
         return
     
@@ -1,184 +1,304 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+
+# Optional Arrow backing for the symptoms string column and the CSV writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    SYMPTOMS_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    SYMPTOMS_DTYPE = 'string'
+
+# Optional Numba JIT for the partial Fisher-Yates helpers below
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _partial_shuffle_prefix(pool: np.ndarray, random_bits: np.ndarray) -> np.ndarray:
+    """First len(random_bits) entries of a random permutation of range(len(pool)).
+
+    pool must hold range(len(pool)) in order. Only that many Fisher-Yates steps
+    are run, each mapping its 32-bit draw onto the range with Lemire's
+    multiply-shift instead of a modulo, and the swaps are undone afterwards so
+    the same pool can be reused without being refilled.
+    """
+    n = len(pool)
+    k = len(random_bits)
+    for i in range(k):
+        j = i + ((random_bits[i] * (n - i)) >> 32)
+        pool[i], pool[j] = pool[j], pool[i]
+    picks = pool[:k].copy()
+    for i in range(k - 1, -1, -1):
+        j = i + ((random_bits[i] * (n - i)) >> 32)
+        pool[i], pool[j] = pool[j], pool[i]
+    return picks
+
+if njit is not None:
+    _partial_shuffle_prefix = njit(cache=True)(_partial_shuffle_prefix)
+
+def _gen_indices(n_symptoms: int, lens: np.ndarray, random_bits: np.ndarray) -> np.ndarray:
+    """(n_cases, max_k) index matrix; row i starts with lens[i] distinct indices below n_symptoms"""
+    n_cases, max_k = random_bits.shape
+    indices = np.zeros((n_cases, max_k), dtype=np.int64)
+    pool = np.arange(n_symptoms)
+    for case in range(n_cases):
+        k = lens[case]
+        indices[case, :k] = _partial_shuffle_prefix(pool, random_bits[case, :k])
+    return indices
+
+if njit is not None:
+    # Compiled without the GIL rather than with parallel=True: the pure-dosha
+    # batches run on their own threads, and numba's default threading layer
+    # cannot launch parallel kernels from worker threads
+    _gen_indices = njit(cache=True, nogil=True)(_gen_indices)
+
+# Vata (Vatham) symptoms - Air and Space elements
+_VATA = np.array([
+    "dry skin", "constipation", "anxiety", "joint pain", "irregular digestion",
+    "insomnia", "nervousness", "dizziness", "trembling", "muscle twitches",
+    "cold hands feet", "dry cough", "hoarse voice", "cracking joints",
+    "restlessness", "worry", "fear", "confusion", "memory loss",
+    "thin body", "weight loss", "bloating", "gas formation", "abdominal pain",
+    "irregular appetite", "scanty urination", "dry hair", "brittle nails",
+    "rough skin", "premature aging", "wrinkles", "stiffness", "arthritis",
+    "sciatica", "paralysis", "convulsions", "epilepsy", "depression mood swings",
+    "rapid speech", "talkativeness", "hyperactivity", "palpitations",
+    "irregular heartbeat", "low blood pressure", "fainting", "weakness",
+    "fatigue", "exhaustion", "noise sensitivity", "light sensitivity",
+    "touch sensitivity", "irregular menstruation", "painful periods",
+    "dry vagina", "premature ejaculation", "impotence", "infertility"
+], dtype=object)
+
+# Pitta (Pitham) symptoms - Fire and Water elements
+_PITTA = np.array([
+    "acidity", "burning sensation", "anger", "skin inflammation", "excessive heat",
+    "irritability", "impatience", "jealousy", "criticism", "perfectionism",
+    "hyperacidity", "heartburn", "ulcers", "diarrhea", "loose stools",
+    "yellow urine", "excessive urination", "sweating", "body odor",
+    "premature graying", "baldness", "red eyes", "yellow eyes",
+    "skin rashes", "acne", "eczema", "psoriasis", "hives",
+    "fever", "inflammation", "infection", "boils", "abscesses",
+    "excessive appetite", "thirst", "craving cold drinks", "aversion to heat",
+    "yellow complexion", "red complexion", "hot flashes", "night sweats",
+    "sharp hunger", "cannot skip meals", "nausea", "vomiting bile",
+    "bitter taste", "sour taste", "metallic taste", "bleeding gums",
+    "nose bleeding", "heavy periods", "early periods", "red blood",
+    "hypertension", "migraine", "tension headache", "eye strain",
+    "photophobia", "conjunctivitis", "stye", "visual disturbances",
+    "liver disorders", "gallbladder problems", "jaundice", "hepatitis"
+], dtype=object)
+
+# Kapha (Kapham) symptoms - Water and Earth elements
+_KAPHA = np.array([
+    "congestion", "weight gain", "lethargy", "cold limbs", "excessive sleep",
+    "sluggishness", "heaviness", "dullness", "attachment", "greed",
+    "possessiveness", "depression", "lack motivation", "procrastination",
+    "excess mucus", "phlegm", "cough with mucus", "runny nose",
+    "sinus congestion", "post nasal drip", "allergies", "asthma",
+    "bronchitis", "pneumonia", "fluid retention", "swelling", "edema",
+    "obesity", "slow digestion", "slow metabolism", "nausea after eating",
+    "sweet taste mouth", "excess saliva", "thick white coating tongue",
+    "pale skin", "oily skin", "large pores", "thick hair", "oily hair",
+    "slow healing", "slow movements", "slow speech", "monotone voice",
+    "cold skin", "cold extremities", "low body temperature", "feeling cold",
+    "high cholesterol", "diabetes", "hypothyroid", "low blood pressure",
+    "slow pulse", "regular appetite", "craving sweets", "craving dairy",
+    "difficulty waking", "oversleeping", "daytime sleepiness", "mental fog",
+    "slow comprehension", "good memory", "loyal nature", "calm disposition",
+    "delayed periods", "heavy periods", "white discharge", "cysts", "tumors"
+], dtype=object)
+
+# Shared by every creator instance, so keep them read-only
+_VATA.setflags(write=False)
+_PITTA.setflags(write=False)
+_KAPHA.setflags(write=False)
+
+# Symptoms outside Ayurvedic dosha analysis (injuries, infections, acute conditions)
+_NO_MATCH_SYMPTOMS = np.array([
+    "broken bone", "car accident", "gunshot wound", "appendicitis",
+    "heart attack", "stroke", "cancer tumor", "chemotherapy side effects",
+    "surgical complications", "antibiotic reaction", "food poisoning bacteria",
+    "viral pneumonia", "covid symptoms", "influenza fever",
+    "malaria parasites", "dengue fever", "typhoid bacteria",
+    "kidney stones", "gallstones", "herniated disc",
+    "torn ligament", "fractured skull", "concussion brain injury",
+    "spinal cord injury", "nerve damage", "muscle tear",
+    "dislocated shoulder", "tennis elbow", "carpal tunnel syndrome",
+    "sports injury", "workplace accident", "burn injury"
+], dtype=object)
+_NO_MATCH_SYMPTOMS.setflags(write=False)
+
+# The two doshas a mixed case can draw its secondary symptoms from
+_SECONDARY_DOSHA = {
+    'vata': ('pitta', 'kapha'),
+    'pitta': ('vata', 'kapha'),
+    'kapha': ('vata', 'pitta')
+}
+
+# Expert-curated cases based on classical Ayurvedic texts
+_EXPERT_CASES = (
+    # Classic Vata cases
+    {
+        'symptoms': 'dry skin constipation joint pain anxiety irregular digestion insomnia',
+        'dosha': 'vata'
+    },
+    {
+        'symptoms': 'nervousness trembling cold hands feet dry cough restlessness memory loss',
+        'dosha': 'vata'
+    },
+    {
+        'symptoms': 'weight loss bloating gas formation abdominal pain irregular appetite',
+        'dosha': 'vata'
+    },
+    
+    # Classic Pitta cases  
+    {
+        'symptoms': 'acidity heartburn anger excessive heat irritability yellow urine',
+        'dosha': 'pitta'
+    },
+    {
+        'symptoms': 'skin inflammation burning sensation fever red eyes excessive sweating',
+        'dosha': 'pitta'
+    },
+    {
+        'symptoms': 'ulcers diarrhea sharp hunger bitter taste excessive thirst',
+        'dosha': 'pitta'
+    },
+    
+    # Classic Kapha cases
+    {
+        'symptoms': 'congestion weight gain lethargy excessive sleep cold limbs sluggishness',
+        'dosha': 'kapha'
+    },
+    {
+        'symptoms': 'excess mucus cough with mucus runny nose slow digestion sweet taste mouth',
+        'dosha': 'kapha'
+    },
+    {
+        'symptoms': 'fluid retention swelling obesity slow metabolism oily skin thick hair',
+        'dosha': 'kapha'
+    }
+)
 
 class AyurvedicDatasetCreator:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         """
         Create dataset based on Ayurvedic principles from Charaka Samhita
         and traditional Ayurvedic knowledge
+
+        Args:
+            seed: Seed for the random generator, for reproducible datasets
         """
+        self._rng = np.random.default_rng(seed)
+        self.vata_symptoms = _VATA
+        self.pitta_symptoms = _PITTA
+        self.kapha_symptoms = _KAPHA
+        # All symptoms in one array so a mixed case can gather across doshas in one index
+        self._all_symptoms_flat = np.concatenate([_VATA, _PITTA, _KAPHA])
+        # (offset into the flat array, pool size) per dosha, computed once
+        self._symptom_spans = {
+            'vata': (0, len(_VATA)),
+            'pitta': (len(_VATA), len(_PITTA)),
+            'kapha': (len(_VATA) + len(_PITTA), len(_KAPHA))
+        }
+        
+        # Fisher-Yates scratch space shared by every draw; always left holding 0..n-1
+        self._scratch = np.arange(max(len(_VATA), len(_PITTA), len(_KAPHA)), dtype=np.int64)
+
+    def generate_symptom_combinations(self, symptoms: List[str], dosha: str, num_combinations: int = 50,
+                                      rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate realistic symptom combinations for a dosha as (symptoms, dosha) columns"""
+        rng = self._rng if rng is None else rng
+        symptoms_arr = np.asarray(symptoms, dtype=object)
         
-        # Vata (Vatham) symptoms - Air and Space elements
-        self.vata_symptoms = [
-            "dry skin", "constipation", "anxiety", "joint pain", "irregular digestion",
-            "insomnia", "nervousness", "dizziness", "trembling", "muscle twitches",
-            "cold hands feet", "dry cough", "hoarse voice", "cracking joints",
-            "restlessness", "worry", "fear", "confusion", "memory loss",
-            "thin body", "weight loss", "bloating", "gas formation", "abdominal pain",
-            "irregular appetite", "scanty urination", "dry hair", "brittle nails",
-            "rough skin", "premature aging", "wrinkles", "stiffness", "arthritis",
-            "sciatica", "paralysis", "convulsions", "epilepsy", "depression mood swings",
-            "rapid speech", "talkativeness", "hyperactivity", "palpitations",
-            "irregular heartbeat", "low blood pressure", "fainting", "weakness",
-            "fatigue", "exhaustion", "noise sensitivity", "light sensitivity",
-            "touch sensitivity", "irregular menstruation", "painful periods",
-            "dry vagina", "premature ejaculation", "impotence", "infertility"
-        ]
+        # Random number of symptoms (2-8 symptoms per case), drawn for all cases at once
+        counts = rng.integers(2, 9, size=num_combinations)
         
-        # Pitta (Pitham) symptoms - Fire and Water elements  
-        self.pitta_symptoms = [
-            "acidity", "burning sensation", "anger", "skin inflammation", "excessive heat",
-            "irritability", "impatience", "jealousy", "criticism", "perfectionism",
-            "hyperacidity", "heartburn", "ulcers", "diarrhea", "loose stools",
-            "yellow urine", "excessive urination", "sweating", "body odor",
-            "premature graying", "baldness", "red eyes", "yellow eyes",
-            "skin rashes", "acne", "eczema", "psoriasis", "hives",
-            "fever", "inflammation", "infection", "boils", "abscesses",
-            "excessive appetite", "thirst", "craving cold drinks", "aversion to heat",
-            "yellow complexion", "red complexion", "hot flashes", "night sweats",
-            "sharp hunger", "cannot skip meals", "nausea", "vomiting bile",
-            "bitter taste", "sour taste", "metallic taste", "bleeding gums",
-            "nose bleeding", "heavy periods", "early periods", "red blood",
-            "hypertension", "migraine", "tension headache", "eye strain",
-            "photophobia", "conjunctivitis", "stye", "visual disturbances",
-            "liver disorders", "gallbladder problems", "jaundice", "hepatitis"
-        ]
+        symptom_texts = self._join_random_picks(symptoms_arr, counts, rng)
         
-        # Kapha (Kapham) symptoms - Water and Earth elements
-        self.kapha_symptoms = [
-            "congestion", "weight gain", "lethargy", "cold limbs", "excessive sleep",
-            "sluggishness", "heaviness", "dullness", "attachment", "greed",
-            "possessiveness", "depression", "lack motivation", "procrastination",
-            "excess mucus", "phlegm", "cough with mucus", "runny nose",
-            "sinus congestion", "post nasal drip", "allergies", "asthma",
-            "bronchitis", "pneumonia", "fluid retention", "swelling", "edema",
-            "obesity", "slow digestion", "slow metabolism", "nausea after eating",
-            "sweet taste mouth", "excess saliva", "thick white coating tongue",
-            "pale skin", "oily skin", "large pores", "thick hair", "oily hair",
-            "slow healing", "slow movements", "slow speech", "monotone voice",
-            "cold skin", "cold extremities", "low body temperature", "feeling cold",
-            "high cholesterol", "diabetes", "hypothyroid", "low blood pressure",
-            "slow pulse", "regular appetite", "craving sweets", "craving dairy",
-            "difficulty waking", "oversleeping", "daytime sleepiness", "mental fog",
-            "slow comprehension", "good memory", "loyal nature", "calm disposition",
-            "delayed periods", "heavy periods", "white discharge", "cysts", "tumors"
-        ]
+        return symptom_texts, np.full(num_combinations, dosha, dtype=object)
 
-    def generate_symptom_combinations(self, symptoms: List[str], dosha: str, num_combinations: int = 50) -> List[Dict]:
-        """Generate realistic symptom combinations for a dosha"""
-        combinations = []
+    @staticmethod
+    def _join_random_picks(symptoms: np.ndarray, counts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Join counts[i] distinct random symptoms into the text of case i"""
+        # One partial Fisher-Yates per case picks just the symptoms it needs
+        num_cases = len(counts)
+        max_count = int(counts.max()) if num_cases else 0
+        random_bits = rng.integers(0, 2**32, size=(num_cases, max_count), dtype=np.int64)
+        order = _gen_indices(len(symptoms), counts, random_bits)
         
-        for _ in range(num_combinations):
-            # Random number of symptoms (2-8 symptoms per case)
-            num_symptoms = np.random.randint(2, 9)
-            
-            # Select random symptoms
-            selected_symptoms = np.random.choice(symptoms, num_symptoms, replace=False)
-            
-            # Join symptoms into a string
-            symptom_text = ' '.join(selected_symptoms)
-            
-            combinations.append({
-                'symptoms': symptom_text,
-                'dosha': dosha,
-                'num_symptoms': num_symptoms
-            })
-            
-        return combinations
+        # Gather every picked symptom in one take, then join plain Python lists
+        selected_rows = symptoms[order].tolist()
+        
+        return np.array(
+            [' '.join(selected[:num_symptoms]) for selected, num_symptoms in zip(selected_rows, counts.tolist())],
+            dtype=object
+        )
 
-    def create_mixed_combinations(self, num_combinations: int = 30) -> List[Dict]:
-        """Create combinations that mix symptoms from different doshas"""
-        combinations = []
+    def _sample_indices(self, n: int, count: int) -> np.ndarray:
+        """Draw count distinct indices from range(n) without shuffling the whole range"""
+        random_bits = self._rng.integers(0, 2**32, size=count, dtype=np.int64)
+        return _partial_shuffle_prefix(self._scratch[:n], random_bits)
+
+    def create_mixed_combinations(self, num_combinations: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+        """Create combinations that mix symptoms from different doshas as (symptoms, dosha) columns"""
+        symptom_texts = np.empty(num_combinations, dtype=object)
+        dosha_names = ('vata', 'pitta', 'kapha')
+        spans = self._symptom_spans
         
-        all_symptoms = {
-            'vata': self.vata_symptoms,
-            'pitta': self.pitta_symptoms, 
-            'kapha': self.kapha_symptoms
-        }
+        # Draw every case's doshas and counts up front
+        # Primary dosha covers 60-80% of the 3-7 symptoms; the secondary is one of the other two
+        primary_doshas = self._rng.integers(0, 3, size=num_combinations)
+        totals = self._rng.integers(3, 8, size=num_combinations)
+        primary_counts = (totals * self._rng.uniform(0.6, 0.8, size=num_combinations)).astype(np.int64)
+        secondary_counts = totals - primary_counts
+        secondary_picks = self._rng.integers(0, 2, size=num_combinations)
         
-        for _ in range(num_combinations):
-            # Choose primary dosha (60-80% of symptoms)
-            primary_dosha = np.random.choice(['vata', 'pitta', 'kapha'])
-            
-            # Choose number of symptoms
-            total_symptoms = np.random.randint(3, 8)
-            primary_count = int(total_symptoms * np.random.uniform(0.6, 0.8))
-            secondary_count = total_symptoms - primary_count
-            
-            # Select primary symptoms
-            primary_symptoms = np.random.choice(
-                all_symptoms[primary_dosha], 
-                primary_count, 
-                replace=False
-            ).tolist()
-            
-            # Select secondary symptoms from other doshas
-            secondary_doshas = [d for d in all_symptoms.keys() if d != primary_dosha]
-            secondary_dosha = np.random.choice(secondary_doshas)
+        for i, (primary, secondary, primary_count, secondary_count) in enumerate(zip(
+                primary_doshas.tolist(), secondary_picks.tolist(),
+                primary_counts.tolist(), secondary_counts.tolist())):
+            primary_dosha = dosha_names[primary]
+            primary_offset, primary_size = spans[primary_dosha]
+            secondary_offset, secondary_size = spans[_SECONDARY_DOSHA[primary_dosha][secondary]]
             
-            secondary_symptoms = np.random.choice(
-                all_symptoms[secondary_dosha],
-                secondary_count,
-                replace=False
-            ).tolist()
+            # Select primary and secondary symptoms
+            primary_idx = self._sample_indices(primary_size, primary_count)
+            secondary_idx = self._sample_indices(secondary_size, secondary_count)
             
-            # Combine symptoms
-            all_case_symptoms = primary_symptoms + secondary_symptoms
-            np.random.shuffle(all_case_symptoms)
+            # Combine symptoms in random order and gather them in one go
+            picks = np.concatenate([primary_idx + primary_offset,
+                                    secondary_idx + secondary_offset])
+            picks = picks[self._rng.permutation(picks.size)]
             
-            symptom_text = ' '.join(all_case_symptoms)
+            symptom_texts[i] = ' '.join(self._all_symptoms_flat[picks].tolist())
             
-            combinations.append({
-                'symptoms': symptom_text,
-                'dosha': primary_dosha,
-                'num_symptoms': total_symptoms,
-                'mixed': True
-            })
-            
-        return combinations
+        return symptom_texts, np.array(dosha_names, dtype=object)[primary_doshas]
 
-    def create_no_match_cases(self, num_cases: int = 20) -> List[Dict]:
-        """Create cases that shouldn't match any dosha"""
-        no_match_symptoms = [
-            "broken bone", "car accident", "gunshot wound", "appendicitis",
-            "heart attack", "stroke", "cancer tumor", "chemotherapy side effects",
-            "surgical complications", "antibiotic reaction", "food poisoning bacteria",
-            "viral pneumonia", "covid symptoms", "influenza fever",
-            "malaria parasites", "dengue fever", "typhoid bacteria",
-            "kidney stones", "gallstones", "herniated disc",
-            "torn ligament", "fractured skull", "concussion brain injury",
-            "spinal cord injury", "nerve damage", "muscle tear",
-            "dislocated shoulder", "tennis elbow", "carpal tunnel syndrome",
-            "sports injury", "workplace accident", "burn injury"
-        ]
-        
-        combinations = []
+    def create_no_match_cases(self, num_cases: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+        """Create cases that shouldn't match any dosha as (symptoms, dosha) columns"""
+        # One to three symptoms per case
+        counts = self._rng.integers(1, 4, size=num_cases)
+        symptom_texts = self._join_random_picks(_NO_MATCH_SYMPTOMS, counts, self._rng)
         
-        for _ in range(num_cases):
-            num_symptoms = np.random.randint(1, 4)
-            selected_symptoms = np.random.choice(no_match_symptoms, num_symptoms, replace=False)
-            symptom_text = ' '.join(selected_symptoms)
-            
-            combinations.append({
-                'symptoms': symptom_text,
-                'dosha': 'no_match',
-                'num_symptoms': num_symptoms
-            })
-            
-        return combinations
+        return symptom_texts, np.full(num_cases, 'no_match', dtype=object)
 
     def create_comprehensive_dataset(self, output_file: str = 'symptoms_dataset.csv'):
         """Create a comprehensive dataset for training"""
         
         print("Creating Ayurvedic symptoms dataset...")
         
-        all_data = []
-        
-        # Generate pure dosha cases
-        vata_cases = self.generate_symptom_combinations(self.vata_symptoms, 'vata', 80)
-        pitta_cases = self.generate_symptom_combinations(self.pitta_symptoms, 'pitta', 80)
-        kapha_cases = self.generate_symptom_combinations(self.kapha_symptoms, 'kapha', 80)
+        # Generate pure dosha cases concurrently, each batch on its own child generator
+        pure_doshas = [(self.vata_symptoms, 'vata'), (self.pitta_symptoms, 'pitta'), (self.kapha_symptoms, 'kapha')]
+        with ThreadPoolExecutor(max_workers=len(pure_doshas)) as executor:
+            futures = [
+                executor.submit(self.generate_symptom_combinations, symptoms, dosha, 80, rng)
+                for (symptoms, dosha), rng in zip(pure_doshas, self._rng.spawn(len(pure_doshas)))
+            ]
+            vata_cases, pitta_cases, kapha_cases = (future.result() for future in futures)
         
         # Generate mixed cases
         mixed_cases = self.create_mixed_combinations(60)
@@ -186,21 +306,28 @@ class AyurvedicDatasetCreator:
         # Generate no-match cases
         no_match_cases = self.create_no_match_cases(30)
         
-        # Combine all cases
-        all_data.extend(vata_cases)
-        all_data.extend(pitta_cases) 
-        all_data.extend(kapha_cases)
-        all_data.extend(mixed_cases)
-        all_data.extend(no_match_cases)
+        # Combine all cases column by column; only mixed cases carry the mixed flag
+        all_cases = [vata_cases, pitta_cases, kapha_cases, mixed_cases, no_match_cases]
+        symptoms, doshas = (np.concatenate(column) for column in zip(*all_cases))
+        mixed = np.full(len(symptoms), None, dtype=object)
+        mixed_start = sum(len(cases[0]) for cases in all_cases[:3])
+        mixed[mixed_start:mixed_start + len(mixed_cases[0])] = True
         
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
+        # Shuffle the data by permuting the columns before building the DataFrame
+        order = self._rng.permutation(len(symptoms))
         
-        # Shuffle the data
-        df = df.sample(frac=1).reset_index(drop=True)
+        # Create DataFrame
+        df = pd.DataFrame({
+            'symptoms': pd.array(symptoms[order], dtype=SYMPTOMS_DTYPE),
+            'dosha': doshas[order],
+            'mixed': mixed[order]
+        })
         
-        # Save to CSV
-        df.to_csv(output_file, index=False)
+        # Save to CSV, letting Arrow serialise whole column buffers when available
+        if pa is not None:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_file)
+        else:
+            df.to_csv(output_file, index=False)
         
         print(f"Dataset created successfully!")
         print(f"Total records: {len(df)}")
@@ -212,51 +339,7 @@ class AyurvedicDatasetCreator:
 
     def add_expert_cases(self) -> List[Dict]:
         """Add expert-curated cases based on classical Ayurvedic texts"""
-        expert_cases = [
-            # Classic Vata cases
-            {
-                'symptoms': 'dry skin constipation joint pain anxiety irregular digestion insomnia',
-                'dosha': 'vata'
-            },
-            {
-                'symptoms': 'nervousness trembling cold hands feet dry cough restlessness memory loss',
-                'dosha': 'vata'
-            },
-            {
-                'symptoms': 'weight loss bloating gas formation abdominal pain irregular appetite',
-                'dosha': 'vata'
-            },
-            
-            # Classic Pitta cases  
-            {
-                'symptoms': 'acidity heartburn anger excessive heat irritability yellow urine',
-                'dosha': 'pitta'
-            },
-            {
-                'symptoms': 'skin inflammation burning sensation fever red eyes excessive sweating',
-                'dosha': 'pitta'
-            },
-            {
-                'symptoms': 'ulcers diarrhea sharp hunger bitter taste excessive thirst',
-                'dosha': 'pitta'
-            },
-            
-            # Classic Kapha cases
-            {
-                'symptoms': 'congestion weight gain lethargy excessive sleep cold limbs sluggishness',
-                'dosha': 'kapha'
-            },
-            {
-                'symptoms': 'excess mucus cough with mucus runny nose slow digestion sweet taste mouth',
-                'dosha': 'kapha'
-            },
-            {
-                'symptoms': 'fluid retention swelling obesity slow metabolism oily skin thick hair',
-                'dosha': 'kapha'
-            }
-        ]
-        
-        return expert_cases
+        return list(_EXPERT_CASES)
 
 # Create dataset when script is run directly
 if __name__ == "__main__":
@@ -73,7 +73,7 @@ def train_model():
     try:
         from ayurvedic_predictor import AyurvedicPredictor
         predictor = AyurvedicPredictor()
-        predictor.train_model()
+        predictor.train_model(verbose=True)
         print("✅ Model training completed")
         return True
     except Exception as e:
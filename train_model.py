@@ -17,11 +17,10 @@ def main():
     # Step 2: Train model
     print("\n2. Training machine learning model...")
     predictor = AyurvedicPredictor()
-    predictor.train_model('symptoms_dataset.csv')
+    predictor.train_model('symptoms_dataset.csv', verbose=True)
     
-    # Step 3: Load model and test
+    # Step 3: Test the trained model already in memory
     print("\n3. Testing trained model...")
-    predictor.load_model()
     
     # Test cases based on traditional Ayurvedic knowledge
     test_cases = [
@@ -1,6 +1,48 @@
+import os
+
+# One BLAS/OpenMP thread per process so several server workers don't oversubscribe the CPU;
+# must be set before numpy and scikit-learn are imported
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+
 from flask import Flask, render_template, request, jsonify
-from ayurvedic_predictor import AyurvedicPredictor
+from ayurvedic_predictor import AyurvedicPredictor, normalize_symptoms
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import lru_cache
 import json
+import queue
+import threading
+import time
+from typing import List
+
+# Optional C-accelerated JSON encoding for responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional typed request decoding; validation happens in C while parsing
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    class PredictRequest(msgspec.Struct):
+        symptoms: List[str] = []
+    
+    class BatchPredictRequest(msgspec.Struct):
+        symptoms_list: List[List[str]] = []
+    
+    _REQUEST_ERRORS = msgspec.DecodeError
+else:
+    PredictRequest = BatchPredictRequest = None
+    _REQUEST_ERRORS = ValueError
+
+# Without msgspec the same request contract is checked by hand: how deeply each
+# field nests lists of strings, and JSON type names for msgspec-style messages
+_FIELD_LIST_DEPTHS = {'symptoms': 1, 'symptoms_list': 2}
+_JSON_TYPE_NAMES = {dict: 'object', list: 'array', str: 'str', int: 'int', float: 'float', bool: 'bool', type(None): 'null'}
 
 app = Flask(__name__)
 
@@ -8,6 +50,93 @@ app = Flask(__name__)
 predictor = AyurvedicPredictor()
 predictor.load_model()
 
+# Warm up so the first request doesn't pay for lazy imports and first-call allocations
+if predictor.model_loaded:
+    try:
+        predictor.predict(['dry skin', 'anxiety'])
+    except Exception as e:
+        print(f"Warning: model warmup failed: {e}")
+
+def _json(obj):
+    """JSON response for obj, encoded with orjson when it is installed"""
+    if orjson is None:
+        return jsonify(obj)
+    return app.response_class(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY), mimetype='application/json')
+
+def _check_type(value, expected: str, path: str):
+    """Raise ValueError, worded like msgspec's, unless value has the expected JSON type"""
+    actual = _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+    if actual != expected:
+        raise ValueError(f"Expected `{expected}`, got `{actual}`" + (f" - at `{path}`" if path != '$' else ''))
+
+def _check_str_lists(value, depth: int, path: str):
+    """Raise ValueError unless value is a list of strings nested depth lists deep"""
+    _check_type(value, 'array' if depth else 'str', path)
+    if depth:
+        for i, item in enumerate(value):
+            _check_str_lists(item, depth - 1, f"{path}[{i}]")
+
+def _request_field(request_type, field: str):
+    """A field of the JSON request body, decoded and type-checked by msgspec when it is installed"""
+    if msgspec is None:
+        # Decode the raw body whatever its Content-Type, as msgspec does
+        try:
+            body = json.loads(request.get_data())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON is malformed: {e.msg} (byte {e.pos})") from None
+        _check_type(body, 'object', '$')
+        value = body.get(field, [])
+        _check_str_lists(value, _FIELD_LIST_DEPTHS[field], f"$.{field}")
+        return value
+    return getattr(msgspec.json.decode(request.get_data(), type=request_type), field)
+
+# model_loaded never changes after start-up, so the health payload is encoded once
+_HEALTH_BODY = json.dumps({'status': 'healthy', 'model_loaded': predictor.model_loaded})
+
+# Micro-batching: concurrent /predict misses are coalesced into one predict_proba_batch call
+BATCH_RESULT_TIMEOUT_SECONDS = 2.0
+BATCH_MAX_SIZE = int(os.environ.get('PREDICT_BATCH_SIZE', '32'))
+BATCH_WINDOW_SECONDS = float(os.environ.get('PREDICT_BATCH_WINDOW_MS', '5')) / 1000
+_pending_predictions = queue.Queue()
+
+def _batch_worker():
+    """Drain up to BATCH_MAX_SIZE queued requests per window and predict them together"""
+    while True:
+        items = [_pending_predictions.get()]
+        deadline = time.monotonic() + BATCH_WINDOW_SECONDS
+        while len(items) < BATCH_MAX_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                items.append(_pending_predictions.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        try:
+            probabilities = predictor.predict_proba_batch([symptoms for symptoms, _ in items])
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+        else:
+            # Rows are shared through the cache below, so nothing may write to them
+            probabilities.setflags(write=False)
+            for (_, future), row in zip(items, probabilities):
+                future.set_result(row)
+
+threading.Thread(target=_batch_worker, name='predict-batcher', daemon=True).start()
+
+def _predict_batched(symptoms):
+    """Queue symptoms for the batch worker and wait for their class probabilities"""
+    future = Future()
+    _pending_predictions.put((symptoms, future))
+    return future.result(timeout=BATCH_RESULT_TIMEOUT_SECONDS)
+
+@lru_cache(maxsize=4096)
+def _cached_proba(symptoms_key: frozenset):
+    """Class probabilities for a set of lowercased symptoms; their order does not change them"""
+    return _predict_batched(sorted(symptoms_key))
+
 @app.route('/')
 def home():
     return render_template('index.html')
@@ -15,48 +144,56 @@ def home():
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
-        data = request.get_json()
-        symptoms = data.get('symptoms', [])
+        try:
+            symptoms = _request_field(PredictRequest, 'symptoms')
+        except _REQUEST_ERRORS as e:
+            return _json({'error': str(e)}), 400
         
         if not symptoms:
-            return jsonify({'error': 'No symptoms provided'})
+            return _json({'error': 'No symptoms provided'})
         
         # Clean and validate symptoms
-        symptoms = [symptom.strip() for symptom in symptoms if symptom.strip()]
+        symptoms = normalize_symptoms(symptoms)
         
         if not symptoms:
-            return jsonify({'error': 'No valid symptoms provided'})
+            return _json({'error': 'No valid symptoms provided'})
+        
+        if not predictor.model_loaded:
+            return _json(predictor.predict(symptoms))
         
-        # Get prediction
-        result = predictor.predict(symptoms)
+        # Only the probabilities are cached; the result is built from the request's
+        # own symptoms so it echoes them, and their recommendations, in order
+        try:
+            probabilities = _cached_proba(frozenset(symptoms))
+        except FutureTimeoutError:
+            return _json({'error': 'Prediction timed out, the server is busy. Please try again.'}), 503
         
-        return jsonify(result)
+        return _json(predictor.format_prediction(probabilities, symptoms))
         
     except Exception as e:
-        return jsonify({'error': str(e)})
+        return _json({'error': str(e)})
 
 @app.route('/batch_predict', methods=['POST'])
 def batch_predict():
     try:
-        data = request.get_json()
-        symptoms_list = data.get('symptoms_list', [])
+        try:
+            symptoms_list = _request_field(BatchPredictRequest, 'symptoms_list')
+        except _REQUEST_ERRORS as e:
+            return _json({'error': str(e)}), 400
         
         if not symptoms_list:
-            return jsonify({'error': 'No symptoms list provided'})
+            return _json({'error': 'No symptoms list provided'})
         
-        results = predictor.predict_batch(symptoms_list)
+        results = predictor.predict_batch([normalize_symptoms(symptoms) for symptoms in symptoms_list])
         
-        return jsonify({'predictions': results})
+        return _json({'predictions': results})
         
     except Exception as e:
-        return jsonify({'error': str(e)})
+        return _json({'error': str(e)})
 
 @app.route('/health')
 def health_check():
-    return jsonify({
-        'status': 'healthy',
-        'model_loaded': predictor.model_loaded
-    })
+    return app.response_class(_HEALTH_BODY, mimetype='application/json')
 
 if __name__ == '__main__':
     if not predictor.model_loaded:
@@ -0,0 +1,7 @@
+"""WSGI entrypoint for running the web application under a production server.
+
+    gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:5000 wsgi:app
+
+Each worker loads its own copy of the predictor on import.
+"""
+from web_app import app